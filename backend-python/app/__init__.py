@@ -1,17 +1,31 @@
+import time
 from flask import Flask
 from flask_cors import CORS
 from app.config import Config
-from app.config.db import init_db
+from app.config.db import start_index_build
+from app.utils.compression import init_compression
+from app.utils.password_hashing import configure_rounds
 
 def create_app():
+    startup_start = time.perf_counter()
+
     app = Flask(__name__)
     app.config.from_object(Config)
     
     # Initialize CORS
     CORS(app)
     
-    # Initialize database
-    init_db()
+    # Initialize response compression
+    init_compression(app)
+    
+    # Choose the bcrypt cost (fixed or calibrated to this machine)
+    rounds = configure_rounds()
+    print(f'bcrypt cost factor: {rounds}')
+    
+    # Creating the database client does no I/O (see app.config.db), and indexes
+    # are built in a background thread, so a slow or unreachable MongoDB cannot
+    # block worker boot or requests.
+    start_index_build()
     
     # Register blueprints
     from app.routes.auth import auth_bp
@@ -32,6 +46,43 @@ def create_app():
             'timestamp': datetime.utcnow().isoformat()
         }
     
+    # Liveness probe - the process is up and serving requests, no DB access
+    @app.route('/api/health/live')
+    def liveness_check():
+        from datetime import datetime
+        return {
+            'success': True,
+            'status': 'alive',
+            'startupTimeMs': app.config['STARTUP_TIME_MS'],
+            'timestamp': datetime.utcnow().isoformat()
+        }
+    
+    # Readiness probe - MongoDB answers quickly and the pool has headroom
+    @app.route('/api/health/ready')
+    def readiness_check():
+        from datetime import datetime
+        from app.config.db import check_db_health
+        
+        db_health = check_db_health()
+        reasons = []
+        
+        if not db_health['connected']:
+            reasons.append('MongoDB is unreachable')
+        elif db_health['latencyMs'] > Config.READINESS_MAX_LATENCY_MS:
+            reasons.append(f"MongoDB latency {db_health['latencyMs']}ms exceeds {Config.READINESS_MAX_LATENCY_MS}ms")
+        
+        if db_health['pool']['saturation'] >= Config.READINESS_MAX_POOL_SATURATION:
+            reasons.append(f"Connection pool saturation {db_health['pool']['saturation']} exceeds {Config.READINESS_MAX_POOL_SATURATION}")
+        
+        ready = not reasons
+        return {
+            'success': ready,
+            'status': 'ready' if ready else 'not ready',
+            'reasons': reasons,
+            'database': db_health,
+            'timestamp': datetime.utcnow().isoformat()
+        }, 200 if ready else 503
+    
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -49,5 +100,8 @@ def create_app():
             'error': str(error) if os.getenv('FLASK_ENV') == 'development' else None
         }, 500
     
+    # Record cold-start cost of building the app
+    app.config['STARTUP_TIME_MS'] = round((time.perf_counter() - startup_start) * 1000, 2)
+    print(f"App created in {app.config['STARTUP_TIME_MS']}ms")
+    
     return app
-
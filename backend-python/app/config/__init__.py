@@ -1,2 +1,51 @@
-# Config package
+import os
+from dotenv import load_dotenv
 
+load_dotenv()
+
+class Config:
+    SECRET_KEY = os.getenv('JWT_SECRET', 'your-secret-key-change-this')
+    MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/crm_db')
+    JWT_SECRET = os.getenv('JWT_SECRET', 'your-secret-key-change-this')
+    FLASK_ENV = os.getenv('FLASK_ENV', 'development')
+    PORT = int(os.getenv('PORT', 5001))
+
+    # MongoDB client settings (the driver default selection timeout is 30s)
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv('MONGODB_SERVER_SELECTION_TIMEOUT_MS', 2000))
+    MONGODB_CONNECT_TIMEOUT_MS = int(os.getenv('MONGODB_CONNECT_TIMEOUT_MS', 2000))
+    MONGODB_MAX_POOL_SIZE = int(os.getenv('MONGODB_MAX_POOL_SIZE', 100))
+
+    # Readiness probe thresholds
+    READINESS_MAX_LATENCY_MS = float(os.getenv('READINESS_MAX_LATENCY_MS', 250))
+    READINESS_MAX_POOL_SATURATION = float(os.getenv('READINESS_MAX_POOL_SATURATION', 0.9))
+
+    # How far ahead the in-process reminder scheduler loads due reminders
+    REMINDER_SCHEDULER_RELOAD_SECONDS = int(os.getenv('REMINDER_SCHEDULER_RELOAD_SECONDS', 300))
+
+    # Per-user dashboard summary cache
+    SUMMARY_CACHE_TTL_SECONDS = int(os.getenv('SUMMARY_CACHE_TTL_SECONDS', 30))
+
+    # Response compression (brotli when the client accepts it, gzip otherwise)
+    COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+    COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+    COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', 6))
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', 4))
+    COMPRESSION_CACHE_MAX_BYTES = int(os.getenv('COMPRESSION_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+
+    # Group-commit batching of form submissions (opt-in)
+    FORM_BATCH_WRITES = os.getenv('FORM_BATCH_WRITES', 'false').lower() == 'true'
+    FORM_BATCH_MAX_SIZE = int(os.getenv('FORM_BATCH_MAX_SIZE', 100))
+    FORM_BATCH_MAX_DELAY_MS = float(os.getenv('FORM_BATCH_MAX_DELAY_MS', 5))
+
+    # Read routing for admin reporting traffic (see READ_PREFERENCES in app/config/db.py);
+    # max staleness must be at least 90 seconds, or -1 for no limit
+    REPORTING_READ_PREFERENCE = os.getenv('REPORTING_READ_PREFERENCE', 'secondaryPreferred')
+    REPORTING_MAX_STALENESS_SECONDS = int(os.getenv('REPORTING_MAX_STALENESS_SECONDS', 90))
+
+    # bcrypt cost: a fixed BCRYPT_ROUNDS, or calibrated at startup to the largest
+    # cost (within min/max) that hashes in BCRYPT_TARGET_MS on this machine.
+    # Calibration runs per worker, so set BCRYPT_ROUNDS when running several.
+    BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 0))
+    BCRYPT_TARGET_MS = float(os.getenv('BCRYPT_TARGET_MS', 250))
+    BCRYPT_MIN_ROUNDS = int(os.getenv('BCRYPT_MIN_ROUNDS', 10))
+    BCRYPT_MAX_ROUNDS = int(os.getenv('BCRYPT_MAX_ROUNDS', 14))
@@ -1,25 +1,219 @@
+import threading
+import time
 from pymongo import MongoClient
+from pymongo.errors import ConnectionFailure, PyMongoError
+from pymongo.monitoring import ConnectionPoolListener
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
 from app.config import Config
-import os
 
 client = None
 db = None
+_init_lock = threading.Lock()
+_index_build_started = False
+
+# Seconds between index build attempts while MongoDB is unreachable (doubling)
+INDEX_BUILD_RETRY_SECONDS = 5
+INDEX_BUILD_MAX_RETRY_SECONDS = 300
+
+# Indexes backing the model queries, created in the background at startup.
+# Each entry is (keys, options); tests/test_query_plans.py checks that every
+# model query is served by one of them.
+INDEXES = {
+    'forms': [
+        ([('userId', 1), ('createdAt', -1)], {}),
+        ([('userId', 1), ('status', 1), ('createdAt', -1)], {}),
+        ([('status', 1), ('createdAt', -1)], {}),
+        ([('createdAt', -1)], {})
+    ],
+    'users': [
+        ([('email', 1)], {'unique': True})
+    ],
+    'reminders': [
+        ([('assignee', 1), ('dueAt', 1), ('status', 1)], {}),
+        ([('status', 1), ('dueAt', 1)], {}),
+        ([('formId', 1)], {})
+    ],
+    'remarks': [
+        ([('formId', 1), ('createdAt', -1), ('_id', -1)], {})
+    ],
+    'form_events': [
+        ([('formId', 1), ('at', 1)], {}),
+        ([('from', 1), ('at', -1)], {}),
+        ([('actor', 1), ('at', -1)], {}),
+        ([('at', -1)], {})
+    ]
+}
+
+READ_MODES = {
+    'primary': Primary,
+    'primaryPreferred': PrimaryPreferred,
+    'secondary': Secondary,
+    'secondaryPreferred': SecondaryPreferred,
+    'nearest': Nearest
+}
+
+def build_read_preference(mode, max_staleness_seconds=-1):
+    """Read preference for a mode name; max staleness does not apply to primary"""
+    if mode not in READ_MODES:
+        raise ValueError(f'Unknown read preference: {mode}')
+    if mode == 'primary':
+        return Primary()
+    return READ_MODES[mode](max_staleness=max_staleness_seconds)
+
+# Read preference per route class. Writes and read-your-own-write paths use the
+# default (primary); admin lists, stats and analytics are 'reporting' reads and
+# may be served by secondaries within REPORTING_MAX_STALENESS_SECONDS.
+READ_PREFERENCES = {
+    'default': Primary(),
+    'reporting': build_read_preference(
+        Config.REPORTING_READ_PREFERENCE,
+        Config.REPORTING_MAX_STALENESS_SECONDS
+    )
+}
+
+class PoolStats(ConnectionPoolListener):
+    """Track connection pool usage from driver events"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.waiting = 0
+        self.open = 0
+
+    def _add(self, field, delta):
+        with self._lock:
+            setattr(self, field, max(getattr(self, field) + delta, 0))
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._add('open', 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._add('open', -1)
+
+    def connection_check_out_started(self, event):
+        self._add('waiting', 1)
+
+    def connection_check_out_failed(self, event):
+        self._add('waiting', -1)
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.waiting = max(self.waiting - 1, 0)
+            self.in_use += 1
+
+    def connection_checked_in(self, event):
+        self._add('in_use', -1)
+
+    def snapshot(self):
+        with self._lock:
+            max_size = Config.MONGODB_MAX_POOL_SIZE
+            return {
+                'inUse': self.in_use,
+                'waiting': self.waiting,
+                'open': self.open,
+                'maxPoolSize': max_size,
+                'saturation': round(self.in_use / max_size, 3) if max_size else 0.0
+            }
+
+pool_stats = PoolStats()
 
 def init_db():
+    """Create the MongoDB client without blocking on server selection.
+
+    The driver connects in the background; the first query (or the readiness
+    probe) is the first thing to wait on the server, bounded by
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS.
+    """
     global client, db
-    try:
-        client = MongoClient(Config.MONGODB_URI)
+    with _init_lock:
+        if db is not None:
+            return db
+        client = MongoClient(
+            Config.MONGODB_URI,
+            serverSelectionTimeoutMS=Config.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            connectTimeoutMS=Config.MONGODB_CONNECT_TIMEOUT_MS,
+            maxPoolSize=Config.MONGODB_MAX_POOL_SIZE,
+            event_listeners=[pool_stats]
+        )
         db = client.get_database()
-        # Test connection
-        client.admin.command('ping')
-        print('MongoDB Connected Successfully')
-    except Exception as error:
-        print(f'MongoDB Connection Error: {error}')
-        raise
+        return db
 
-def get_db():
+def ensure_indexes():
+    """Create the indexes in INDEXES (idempotent) and return the ones that failed.
+
+    An index the server rejects (e.g. a unique index over duplicate data) is
+    logged and skipped; ConnectionFailure propagates when MongoDB is unreachable.
+    """
+    database = init_db()
+    failed = []
+    for collection, indexes in INDEXES.items():
+        for keys, options in indexes:
+            try:
+                database[collection].create_index(keys, **options)
+            except ConnectionFailure:
+                raise
+            except PyMongoError as error:
+                print(f'MongoDB Index Creation Error ({collection} {keys}): {error}')
+                failed.append((collection, keys))
+    return failed
+
+def _build_indexes():
+    delay = INDEX_BUILD_RETRY_SECONDS
+    while True:
+        try:
+            ensure_indexes()
+            return
+        except ConnectionFailure as error:
+            print(f'MongoDB unavailable for index creation, retrying in {delay}s: {error}')
+            time.sleep(delay)
+            delay = min(delay * 2, INDEX_BUILD_MAX_RETRY_SECONDS)
+
+def start_index_build():
+    """Create INDEXES once in a background thread so no request waits on it"""
+    global _index_build_started
+    with _init_lock:
+        if _index_build_started:
+            return
+        _index_build_started = True
+    threading.Thread(target=_build_indexes, name='mongodb-index-build', daemon=True).start()
+
+def get_db(read_class='default'):
+    """Database handle reading with the preference configured for read_class"""
     global db
     if db is None:
         init_db()
-    return db
+    if read_class == 'default':
+        return db
+    return db.with_options(read_preference=READ_PREFERENCES[read_class])
+
+def check_db_health():
+    """Ping MongoDB and report round-trip latency and pool usage"""
+    init_db()
+    pool = pool_stats.snapshot()
+    start = time.perf_counter()
+    try:
+        client.admin.command('ping')
+    except Exception as error:
+        return {'connected': False, 'error': str(error), 'pool': pool}
 
+    latency_ms = (time.perf_counter() - start) * 1000
+    return {
+        'connected': True,
+        'latencyMs': round(latency_ms, 2),
+        'pool': pool
+    }
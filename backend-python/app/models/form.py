@@ -1,12 +1,27 @@
 from datetime import datetime
 from bson import ObjectId
+from pymongo import ReturnDocument
+from app.config import Config
 from app.config.db import get_db
+from app.models.form_event import FormEvent
+from app.utils.batch_writer import BatchWriter
+from app.utils.cache import TTLCache
+
+STATUSES = ['pending', 'approved', 'rejected']
+
+# Dashboard summaries keyed by (user_id, recent_limit)
+summary_cache = TTLCache(Config.SUMMARY_CACHE_TTL_SECONDS)
+
+# Group-commit writers used by Form.create when FORM_BATCH_WRITES is enabled
+form_writer = BatchWriter('forms', Config.FORM_BATCH_MAX_SIZE, Config.FORM_BATCH_MAX_DELAY_MS)
+form_event_writer = BatchWriter('form_events', Config.FORM_BATCH_MAX_SIZE, Config.FORM_BATCH_MAX_DELAY_MS)
 
 class Form:
     @staticmethod
     def create(user_id, title, description, category, priority='Medium'):
         db = get_db()
         forms = db.forms
+        now = datetime.utcnow()
         
         form_data = {
             'userId': ObjectId(user_id),
@@ -18,12 +33,27 @@ class Form:
             'reviewedBy': None,
             'reviewedAt': None,
             'reviewComment': '',
-            'createdAt': datetime.utcnow(),
-            'updatedAt': datetime.utcnow()
+            'remarkCount': 0,
+            'lastRemark': None,
+            'statusChangedAt': now,
+            'createdAt': now,
+            'updatedAt': now
         }
         
-        result = forms.insert_one(form_data)
-        form_data['_id'] = result.inserted_id
+        if Config.FORM_BATCH_WRITES:
+            # Ids are assigned here so each caller knows its own after the shared insert_many
+            form_data['_id'] = ObjectId()
+            form_writer.submit(form_data).result()
+            # Queued only once the form is stored, so a failed form insert
+            # never leaves a creation event behind
+            event_data = FormEvent.build(form_data['_id'], None, 'pending', user_id, now)
+            event_data['_id'] = ObjectId()
+            form_event_writer.submit(event_data).result()
+        else:
+            result = forms.insert_one(form_data)
+            form_data['_id'] = result.inserted_id
+            FormEvent.record(result.inserted_id, None, 'pending', user_id, now)
+        Form.invalidate_summary(user_id)
         return form_data
     
     @staticmethod
@@ -34,6 +64,11 @@ class Form:
         except:
             return None
     
+    @staticmethod
+    def find_by_ids(form_ids):
+        db = get_db()
+        return list(db.forms.find({'_id': {'$in': [ObjectId(form_id) for form_id in form_ids]}}))
+    
     @staticmethod
     def find_by_user_id(user_id, status=None):
         db = get_db()
@@ -44,8 +79,8 @@ class Form:
         return list(db.forms.find(query).sort('createdAt', -1))
     
     @staticmethod
-    def find_all(status=None):
-        db = get_db()
+    def find_all(status=None, read_class='default'):
+        db = get_db(read_class)
         query = {}
         if status:
             query['status'] = status
@@ -53,42 +88,124 @@ class Form:
         return list(db.forms.find(query).sort('createdAt', -1))
     
     @staticmethod
-    def find_pending():
-        db = get_db()
+    def find_pending(read_class='default'):
+        db = get_db(read_class)
         return list(db.forms.find({'status': 'pending'}).sort('createdAt', -1))
     
     @staticmethod
     def update_status(form_id, status, reviewed_by, review_comment):
         db = get_db()
+        now = datetime.utcnow()
         update_data = {
             'status': status,
             'reviewedBy': ObjectId(reviewed_by),
-            'reviewedAt': datetime.utcnow(),
+            'reviewedAt': now,
             'reviewComment': review_comment,
-            'updatedAt': datetime.utcnow()
+            'statusChangedAt': now,
+            'updatedAt': now
         }
         
-        db.forms.update_one(
+        # Read the previous status in the same round trip to log the transition
+        previous = db.forms.find_one_and_update(
             {'_id': ObjectId(form_id)},
-            {'$set': update_data}
+            {'$set': update_data},
+            return_document=ReturnDocument.BEFORE
         )
+        if not previous:
+            return None
         
-        return Form.find_by_id(form_id)
+        entered_at = previous.get('statusChangedAt') or previous.get('createdAt')
+        duration_ms = int((now - entered_at).total_seconds() * 1000) if entered_at else None
+        FormEvent.record(form_id, previous.get('status'), status, reviewed_by, now, duration_ms)
+        
+        Form.invalidate_summary(previous['userId'])
+        return {**previous, **update_data}
     
     @staticmethod
     def delete(form_id):
         db = get_db()
-        result = db.forms.delete_one({'_id': ObjectId(form_id)})
-        return result.deleted_count > 0
+        form = db.forms.find_one_and_delete({'_id': ObjectId(form_id)}, projection={'userId': 1})
+        if not form:
+            return False
+        Form.invalidate_summary(form['userId'])
+        return True
     
     @staticmethod
-    def count_all():
+    def get_summary(user, recent_limit):
+        """Per-status counts and the most recent forms for one user.
+
+        Computed with a single aggregation on the (userId, createdAt) index that
+        also looks up reviewers, and cached briefly per user; writes to the
+        user's forms invalidate it. `user` is the owner's document, which
+        supplies the submitter block without another read.
+        """
+        user_id = user['_id']
+        cache_key = (str(user_id), recent_limit)
+        summary = summary_cache.get(cache_key)
+        if summary is not None:
+            return summary
+        
         db = get_db()
-        return db.forms.count_documents({})
+        pipeline = [
+            {'$match': {'userId': ObjectId(user_id)}},
+            {'$sort': {'createdAt': -1}},
+            {'$facet': {
+                'counts': [{'$group': {'_id': '$status', 'count': {'$sum': 1}}}],
+                'recent': [
+                    {'$limit': recent_limit},
+                    {'$lookup': {
+                        'from': 'users',
+                        'let': {'reviewer': '$reviewedBy'},
+                        'pipeline': [
+                            {'$match': {'$expr': {'$eq': ['$_id', '$$reviewer']}}},
+                            {'$project': {'name': 1, 'email': 1}}
+                        ],
+                        'as': 'reviewer'
+                    }}
+                ]
+            }}
+        ]
+        result = next(db.forms.aggregate(pipeline), {'counts': [], 'recent': []})
+        
+        counts = {status: 0 for status in STATUSES}
+        for row in result['counts']:
+            counts[row['_id']] = row['count']
+        counts['total'] = sum(row['count'] for row in result['counts'])
+        
+        submitter = {
+            '_id': user['_id'],
+            'name': user.get('name'),
+            'email': user.get('email')
+        }
+        recent = []
+        for form in result['recent']:
+            reviewer = form.pop('reviewer')
+            form['userId'] = submitter
+            if form.get('reviewedBy'):
+                form['reviewedBy'] = reviewer[0] if reviewer else None
+            recent.append(Form.to_dict(form))
+        
+        summary = {
+            'counts': counts,
+            'recent': recent
+        }
+        summary_cache.set(cache_key, summary)
+        return summary
     
     @staticmethod
-    def count_by_status(status):
-        db = get_db()
+    def invalidate_summary(user_id):
+        user_id = str(user_id)
+        summary_cache.invalidate(lambda key: key[0] == user_id)
+    
+    @staticmethod
+    def count_all(read_class='default'):
+        db = get_db(read_class)
+        # Collection metadata count; count_documents({}) would scan every form
+        return db.forms.estimated_document_count()
+    
+    @staticmethod
+    def count_by_status(status, read_class='default'):
+        db = get_db(read_class)
         return db.forms.count_documents({'status': status})
     
     @staticmethod
@@ -118,6 +235,37 @@ class Form:
         
         return form
     
+    @staticmethod
+    def populate_users_info(forms, read_class='default'):
+        """Populate userId and reviewedBy on a list of forms with one users query"""
+        from app.models.user import User
+        
+        user_ids = {form['userId'] for form in forms if form.get('userId')}
+        user_ids.update(form['reviewedBy'] for form in forms if form.get('reviewedBy'))
+        users = {user['_id']: user for user in User.find_by_ids(user_ids, read_class)} if user_ids else {}
+        
+        for form in forms:
+            user = users.get(form.get('userId'))
+            if user:
+                form['userId'] = {
+                    '_id': user['_id'],
+                    'name': user.get('name'),
+                    'email': user.get('email')
+                }
+            
+            if form.get('reviewedBy'):
+                reviewer = users.get(form['reviewedBy'])
+                if reviewer:
+                    form['reviewedBy'] = {
+                        '_id': reviewer['_id'],
+                        'name': reviewer.get('name'),
+                        'email': reviewer.get('email')
+                    }
+                else:
+                    form['reviewedBy'] = None
+        
+        return forms
+    
     @staticmethod
     def to_dict(form):
         if not form:
@@ -125,18 +273,44 @@ class Form:
         
         form_dict = {
             'id': str(form['_id']),
-            'userId': str(form['userId']) if isinstance(form['userId'], ObjectId) else form['userId'],
+            'userId': Form.user_ref_to_dict(form['userId']),
             'title': form.get('title'),
             'description': form.get('description'),
             'category': form.get('category'),
             'priority': form.get('priority'),
             'status': form.get('status'),
-            'reviewedBy': str(form['reviewedBy']) if isinstance(form.get('reviewedBy'), ObjectId) else form.get('reviewedBy'),
+            'reviewedBy': Form.user_ref_to_dict(form.get('reviewedBy')),
             'reviewedAt': form.get('reviewedAt').isoformat() if form.get('reviewedAt') else None,
             'reviewComment': form.get('reviewComment', ''),
             'createdAt': form.get('createdAt').isoformat() if form.get('createdAt') else None,
-            'updatedAt': form.get('updatedAt').isoformat() if form.get('updatedAt') else None
+            'updatedAt': form.get('updatedAt').isoformat() if form.get('updatedAt') else None,
+            'remarkCount': form.get('remarkCount', 0),
+            'lastRemark': Form.last_remark_to_dict(form.get('lastRemark'))
         }
         
         return form_dict
-
+    
+    @staticmethod
+    def user_ref_to_dict(user_ref):
+        """Serialize a user id or a populated {_id, name, email} block"""
+        if isinstance(user_ref, ObjectId):
+            return str(user_ref)
+        if isinstance(user_ref, dict):
+            return {
+                '_id': str(user_ref['_id']),
+                'name': user_ref.get('name'),
+                'email': user_ref.get('email')
+            }
+        return user_ref
+    
+    @staticmethod
+    def last_remark_to_dict(last_remark):
+        if not last_remark:
+            return None
+        
+        return {
+            'senderName': last_remark.get('senderName'),
+            'senderRole': last_remark.get('senderRole'),
+            'message': last_remark.get('message'),
+            'createdAt': last_remark.get('createdAt').isoformat() if last_remark.get('createdAt') else None
+        }
@@ -0,0 +1,131 @@
+from bson import ObjectId
+from app.config.db import get_db
+
+PERCENTILES = [50, 90, 95, 99]
+
+class FormEvent:
+    """Append-only log of form status transitions in `form_events`.
+
+    Each event records the previous and new status, who made the change, when,
+    and how long the form spent in the previous status (`durationMs`), so
+    reporting aggregates over this log instead of scanning `forms`.
+    """
+
+    @staticmethod
+    def build(form_id, from_status, to_status, actor, at, duration_ms=None):
+        return {
+            'formId': ObjectId(form_id),
+            'from': from_status,
+            'to': to_status,
+            'actor': ObjectId(actor),
+            'at': at,
+            'durationMs': duration_ms
+        }
+    
+    @staticmethod
+    def record(form_id, from_status, to_status, actor, at, duration_ms=None):
+        db = get_db()
+        event_data = FormEvent.build(form_id, from_status, to_status, actor, at, duration_ms)
+        result = db.form_events.insert_one(event_data)
+        event_data['_id'] = result.inserted_id
+        return event_data
+    
+    @staticmethod
+    def find_by_form(form_id):
+        db = get_db()
+        return list(db.form_events.find({'formId': ObjectId(form_id)}).sort('at', 1))
+    
+    @staticmethod
+    def reviewer_throughput(start, end, actor=None, read_class='default'):
+        """Reviews per reviewer between start and end, split by outcome"""
+        db = get_db(read_class)
+        match = {'from': 'pending', 'at': {'$gte': start, '$lt': end}}
+        if actor:
+            match['actor'] = ObjectId(actor)
+        
+        pipeline = [
+            {'$match': match},
+            {'$group': {
+                '_id': '$actor',
+                'reviewed': {'$sum': 1},
+                'approved': {'$sum': {'$cond': [{'$eq': ['$to', 'approved']}, 1, 0]}},
+                'rejected': {'$sum': {'$cond': [{'$eq': ['$to', 'rejected']}, 1, 0]}},
+                'averagePendingMs': {'$avg': '$durationMs'}
+            }},
+            {'$sort': {'reviewed': -1}},
+            {'$lookup': {
+                'from': 'users',
+                'let': {'actor': '$_id'},
+                'pipeline': [
+                    {'$match': {'$expr': {'$eq': ['$_id', '$$actor']}}},
+                    {'$project': {'name': 1, 'email': 1}}
+                ],
+                'as': 'reviewer'
+            }}
+        ]
+        
+        return [
+            {
+                'reviewerId': str(row['_id']),
+                'name': row['reviewer'][0].get('name') if row['reviewer'] else None,
+                'email': row['reviewer'][0].get('email') if row['reviewer'] else None,
+                'reviewed': row['reviewed'],
+                'approved': row['approved'],
+                'rejected': row['rejected'],
+                'averagePendingMs': row['averagePendingMs']
+            }
+            for row in db.form_events.aggregate(pipeline)
+        ]
+    
+    @staticmethod
+    def pending_time_percentiles(start, end, read_class='default'):
+        """Percentiles of time spent pending for forms reviewed between start and end.
+
+        Uses $percentile (MongoDB 7.0+), which keeps a bounded-size digest per
+        group instead of every duration, so any range fits in one $group.
+        Its only method on 7.0 is 'approximate'.
+        """
+        db = get_db(read_class)
+        
+        pipeline = [
+            {'$match': {'from': 'pending', 'at': {'$gte': start, '$lt': end}, 'durationMs': {'$ne': None}}},
+            {'$group': {
+                '_id': None,
+                'count': {'$sum': 1},
+                'averageMs': {'$avg': '$durationMs'},
+                'maxMs': {'$max': '$durationMs'},
+                'percentiles': {'$percentile': {
+                    'input': '$durationMs',
+                    'p': [p / 100 for p in PERCENTILES],
+                    'method': 'approximate'
+                }}
+            }},
+            {'$project': {
+                '_id': 0,
+                'count': 1,
+                'averageMs': 1,
+                'maxMs': 1,
+                **{f'p{p}Ms': {'$arrayElemAt': ['$percentiles', i]} for i, p in enumerate(PERCENTILES)}
+            }}
+        ]
+        
+        result = next(db.form_events.aggregate(pipeline), None)
+        if not result:
+            result = {'count': 0, 'averageMs': None, 'maxMs': None}
+            result.update({f'p{p}Ms': None for p in PERCENTILES})
+        return result
+    
+    @staticmethod
+    def to_dict(event):
+        if not event:
+            return None
+        
+        return {
+            'id': str(event['_id']),
+            'formId': str(event['formId']),
+            'from': event.get('from'),
+            'to': event.get('to'),
+            'actor': str(event['actor']) if event.get('actor') else None,
+            'at': event.get('at').isoformat() if event.get('at') else None,
+            'durationMs': event.get('durationMs')
+        }
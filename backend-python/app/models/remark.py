@@ -0,0 +1,127 @@
+import base64
+from datetime import datetime
+from bson import ObjectId
+from app.config.db import get_db
+from app.models.form import Form
+
+# Longest message kept in the lastRemark summary stored on the form
+SUMMARY_LENGTH = 200
+
+class Remark:
+    """Append-only remarks log, one document per remark in `remarks`.
+
+    Forms only carry `remarkCount` and a `lastRemark` summary, so their size
+    does not grow with the discussion.
+    """
+
+    @staticmethod
+    def create(form_id, sender, message):
+        db = get_db()
+        
+        remark_data = {
+            'formId': ObjectId(form_id),
+            'senderId': sender['_id'],
+            'senderName': sender.get('name', ''),
+            'senderRole': sender.get('role', 'user'),
+            'message': message.strip(),
+            'createdAt': datetime.utcnow()
+        }
+        
+        result = db.remarks.insert_one(remark_data)
+        remark_data['_id'] = result.inserted_id
+        
+        form = db.forms.find_one_and_update(
+            {'_id': ObjectId(form_id)},
+            {
+                '$inc': {'remarkCount': 1},
+                '$set': {
+                    'lastRemark': {
+                        'senderName': remark_data['senderName'],
+                        'senderRole': remark_data['senderRole'],
+                        'message': remark_data['message'][:SUMMARY_LENGTH],
+                        'createdAt': remark_data['createdAt']
+                    }
+                }
+            },
+            projection={'userId': 1}
+        )
+        if form:
+            # Cached dashboard summaries carry remarkCount/lastRemark
+            Form.invalidate_summary(form['userId'])
+        
+        return remark_data
+    
+    @staticmethod
+    def find_by_form(form_id, limit, cursor=None, start_date=None, end_date=None):
+        """Newest-first page of a form's remarks.
+
+        Returns (remarks, next_cursor); next_cursor is None on the last page.
+        """
+        db = get_db()
+        query = {'formId': ObjectId(form_id)}
+        
+        if cursor:
+            created_at, remark_id = cursor
+            # The $lte bound keeps the index scan starting at the cursor; the
+            # $or only breaks ties between remarks with the same createdAt
+            end_date = min(end_date, created_at) if end_date else created_at
+            query['$or'] = [
+                {'createdAt': {'$lt': created_at}},
+                {'createdAt': created_at, '_id': {'$lt': remark_id}}
+            ]
+        
+        created_range = {}
+        if start_date:
+            created_range['$gte'] = start_date
+        if end_date:
+            created_range['$lte'] = end_date
+        if created_range:
+            query['createdAt'] = created_range
+        
+        remarks = list(
+            db.remarks.find(query)
+            .sort([('createdAt', -1), ('_id', -1)])
+            .limit(limit + 1)
+        )
+        
+        next_cursor = None
+        if len(remarks) > limit:
+            remarks = remarks[:limit]
+            next_cursor = Remark.encode_cursor(remarks[-1])
+        
+        return remarks, next_cursor
+    
+    @staticmethod
+    def delete_by_form(form_id):
+        db = get_db()
+        db.remarks.delete_many({'formId': ObjectId(form_id)})
+    
+    @staticmethod
+    def encode_cursor(remark):
+        raw = f"{remark['createdAt'].isoformat()}|{remark['_id']}"
+        return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+    
+    @staticmethod
+    def decode_cursor(cursor):
+        """Return (createdAt, _id) for a cursor string, or None if invalid"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+            created_at, remark_id = raw.split('|')
+            return datetime.fromisoformat(created_at), ObjectId(remark_id)
+        except:
+            return None
+    
+    @staticmethod
+    def to_dict(remark):
+        if not remark:
+            return None
+        
+        return {
+            'id': str(remark['_id']),
+            'formId': str(remark['formId']),
+            'senderId': str(remark['senderId']),
+            'senderName': remark.get('senderName'),
+            'senderRole': remark.get('senderRole'),
+            'message': remark.get('message'),
+            'createdAt': remark.get('createdAt').isoformat() if remark.get('createdAt') else None
+        }
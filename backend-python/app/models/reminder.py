@@ -0,0 +1,113 @@
+from datetime import datetime
+from bson import ObjectId
+from app.config.db import get_db
+
+ACTIVE_STATUSES = ['pending', 'incomplete']
+VALID_STATUSES = ['pending', 'completed', 'incomplete', 'rescheduled']
+
+class Reminder:
+    """Form reminders, one document per reminder in the `reminders` collection.
+
+    Due lookups are range queries on the (assignee, dueAt, status) index
+    instead of scans over reminder arrays embedded in forms.
+    """
+
+    @staticmethod
+    def create(form, due_at, message, set_by):
+        db = get_db()
+        
+        reminder_data = {
+            'formId': form['_id'],
+            'assignee': form['userId'],
+            'dueAt': due_at,
+            'message': (message or '').strip(),
+            'status': 'pending',
+            'setBy': set_by['_id'],
+            'setByName': set_by.get('name', ''),
+            'completedAt': None,
+            'completedBy': None,
+            'createdAt': datetime.utcnow()
+        }
+        
+        result = db.reminders.insert_one(reminder_data)
+        reminder_data['_id'] = result.inserted_id
+        return reminder_data
+    
+    @staticmethod
+    def find_by_id(reminder_id):
+        db = get_db()
+        try:
+            return db.reminders.find_one({'_id': ObjectId(reminder_id)})
+        except:
+            return None
+    
+    @staticmethod
+    def find_active(assignee=None, due_after=None, due_before=None):
+        """Active reminders ordered by due time, optionally within a due range"""
+        db = get_db()
+        query = {'status': {'$in': ACTIVE_STATUSES}}
+        if assignee:
+            query['assignee'] = ObjectId(assignee)
+        
+        due_range = {}
+        if due_after:
+            due_range['$gt'] = due_after
+        if due_before:
+            due_range['$lte'] = due_before
+        if due_range:
+            query['dueAt'] = due_range
+        
+        return list(db.reminders.find(query).sort('dueAt', 1))
+    
+    @staticmethod
+    def update_status(reminder_id, status, completed_by, message=None):
+        db = get_db()
+        update_data = {}
+        
+        if message is not None:
+            update_data['message'] = message.strip()
+        
+        if status:
+            update_data['status'] = status
+            if status in ('completed', 'rescheduled'):
+                update_data['completedAt'] = datetime.utcnow()
+                update_data['completedBy'] = ObjectId(completed_by)
+            else:
+                update_data['completedAt'] = None
+                update_data['completedBy'] = None
+        
+        if not update_data:
+            return Reminder.find_by_id(reminder_id)
+        
+        db.reminders.update_one(
+            {'_id': ObjectId(reminder_id)},
+            {'$set': update_data}
+        )
+        
+        return Reminder.find_by_id(reminder_id)
+    
+    @staticmethod
+    def delete_by_form(form_id):
+        db = get_db()
+        db.reminders.delete_many({'formId': ObjectId(form_id)})
+    
+    @staticmethod
+    def to_dict(reminder):
+        if not reminder:
+            return None
+        
+        status = reminder.get('status', 'pending')
+        return {
+            'id': str(reminder['_id']),
+            'formId': str(reminder['formId']),
+            'assignee': str(reminder['assignee']),
+            'dateTime': reminder.get('dueAt').isoformat() if reminder.get('dueAt') else None,
+            'message': reminder.get('message', ''),
+            'status': status,
+            'isCompleted': status in ('completed', 'rescheduled'),
+            'setBy': str(reminder['setBy']) if reminder.get('setBy') else None,
+            'setByName': reminder.get('setByName', ''),
+            'completedAt': reminder.get('completedAt').isoformat() if reminder.get('completedAt') else None,
+            'completedBy': str(reminder['completedBy']) if reminder.get('completedBy') else None,
+            'createdAt': reminder.get('createdAt').isoformat() if reminder.get('createdAt') else None
+        }
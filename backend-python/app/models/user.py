@@ -1,6 +1,7 @@
 from datetime import datetime
 from bson import ObjectId
 from app.config.db import get_db
+from app.utils.password_hashing import get_rounds, hash_rounds
 import bcrypt
 
 class User:
@@ -9,14 +10,10 @@ class User:
         db = get_db()
         users = db.users
         
-        # Hash password
-        salt = bcrypt.gensalt(rounds=10)
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
-        
         user_data = {
             'name': name.strip(),
             'email': email.lower().strip(),
-            'password': hashed_password.decode('utf-8'),
+            'password': User.hash_password(password),
             'role': role if role == 'admin' else 'user',
             'createdAt': datetime.utcnow()
         }
@@ -39,6 +36,37 @@ class User:
         except:
             return None
     
+    @staticmethod
+    def find_by_ids(user_ids, read_class='default'):
+        db = get_db(read_class)
+        return list(db.users.find(
+            {'_id': {'$in': [ObjectId(user_id) for user_id in user_ids]}},
+            {'name': 1, 'email': 1}
+        ))
+    
+    @staticmethod
+    def hash_password(password):
+        salt = bcrypt.gensalt(rounds=get_rounds())
+        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    
+    @staticmethod
+    def needs_rehash(hashed_password):
+        """True when a stored hash uses a lower cost than the configured one.
+
+        Only upgrades: workers that calibrate to different costs would
+        otherwise rewrite each other's hashes on every login.
+        """
+        stored_rounds = hash_rounds(hashed_password)
+        return stored_rounds is None or stored_rounds < get_rounds()
+    
+    @staticmethod
+    def update_password_hash(user_id, password):
+        db = get_db()
+        db.users.update_one(
+            {'_id': ObjectId(user_id)},
+            {'$set': {'password': User.hash_password(password)}}
+        )
+    
     @staticmethod
     def compare_password(hashed_password, candidate_password):
         return bcrypt.checkpw(
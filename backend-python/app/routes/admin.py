@@ -1,9 +1,38 @@
-from flask import Blueprint, request, jsonify
-from app.models.form import Form
+from datetime import datetime, timedelta
+from flask import Blueprint, request, jsonify, current_app
+from bson import ObjectId
+from app.config import Config
+from app.models.form import Form, form_writer, form_event_writer
+from app.models.form_event import FormEvent
 from app.middleware.auth import protect, authorize
+from app.routes.forms import parse_datetime, create_reminder
+from app.utils.single_flight import SingleFlight
 
 admin_bp = Blueprint('admin', __name__)
 
+ANALYTICS_DEFAULT_DAYS = 30
+
+# Identical concurrent admin reads share one query and one serialized body
+admin_queries = SingleFlight()
+
+def coalesced_json(key, build_payload):
+    """Serve build_payload() as JSON, sharing it with identical in-flight requests"""
+    body = admin_queries.do(key, lambda: current_app.json.dumps(build_payload()))
+    return current_app.response_class(body, status=200, mimetype='application/json')
+
+def forms_payload(forms):
+    # Submitters and reviewers come from one users query on the reporting handle
+    forms_with_populated = [
+        Form.to_dict(form)
+        for form in Form.populate_users_info(forms, read_class='reporting')
+    ]
+    
+    return {
+        'success': True,
+        'count': len(forms_with_populated),
+        'forms': forms_with_populated
+    }
+
 @admin_bp.route('/forms', methods=['GET'])
 @protect
 @authorize('admin')
@@ -11,19 +40,10 @@ def get_all_forms():
     try:
         status = request.args.get('status')
         
-        forms = Form.find_all(status)
-        
-        # Populate user info for each form
-        forms_with_populated = []
-        for form in forms:
-            form = Form.populate_user_info(form)
-            forms_with_populated.append(Form.to_dict(form))
-        
-        return jsonify({
-            'success': True,
-            'count': len(forms_with_populated),
-            'forms': forms_with_populated
-        }), 200
+        return coalesced_json(
+            ('forms', status),
+            lambda: forms_payload(Form.find_all(status, read_class='reporting'))
+        )
         
     except Exception as e:
         return jsonify({
@@ -37,19 +57,10 @@ def get_all_forms():
 @authorize('admin')
 def get_pending_forms():
     try:
-        forms = Form.find_pending()
-        
-        # Populate user info for each form
-        forms_with_populated = []
-        for form in forms:
-            form = Form.populate_user_info(form)
-            forms_with_populated.append(Form.to_dict(form))
-        
-        return jsonify({
-            'success': True,
-            'count': len(forms_with_populated),
-            'forms': forms_with_populated
-        }), 200
+        return coalesced_json(
+            ('forms', 'pending'),
+            lambda: forms_payload(Form.find_pending(read_class='reporting'))
+        )
         
     except Exception as e:
         return jsonify({
@@ -161,19 +172,86 @@ def reject_form(form_id):
 @authorize('admin')
 def get_stats():
     try:
-        total_forms = Form.count_all()
-        pending_forms = Form.count_by_status('pending')
-        approved_forms = Form.count_by_status('approved')
-        rejected_forms = Form.count_by_status('rejected')
-        
-        return jsonify({
+        return coalesced_json(('stats',), lambda: {
             'success': True,
             'stats': {
-                'total': total_forms,
-                'pending': pending_forms,
-                'approved': approved_forms,
-                'rejected': rejected_forms
+                'total': Form.count_all(read_class='reporting'),
+                'pending': Form.count_by_status('pending', read_class='reporting'),
+                'approved': Form.count_by_status('approved', read_class='reporting'),
+                'rejected': Form.count_by_status('rejected', read_class='reporting')
             }
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
+@admin_bp.route('/forms/<form_id>/reminder', methods=['POST'])
+@protect
+@authorize('admin')
+def add_reminder(form_id):
+    try:
+        # Admins pass the owner-or-admin check in create_reminder
+        return create_reminder(form_id)
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
+def parse_range():
+    """Read the from/to query range, defaulting to the last ANALYTICS_DEFAULT_DAYS days"""
+    end = parse_datetime(request.args.get('to')) or datetime.utcnow()
+    start = parse_datetime(request.args.get('from')) or end - timedelta(days=ANALYTICS_DEFAULT_DAYS)
+    return start, end
+
+@admin_bp.route('/analytics/throughput', methods=['GET'])
+@protect
+@authorize('admin')
+def get_reviewer_throughput():
+    try:
+        reviewer = request.args.get('reviewer')
+        if reviewer and not ObjectId.is_valid(reviewer):
+            return jsonify({
+                'success': False,
+                'errors': [{'field': 'reviewer', 'message': 'Invalid reviewer id'}]
+            }), 400
+        
+        start, end = parse_range()
+        reviewers = FormEvent.reviewer_throughput(start, end, reviewer, read_class='reporting')
+        
+        return jsonify({
+            'success': True,
+            'from': start.isoformat(),
+            'to': end.isoformat(),
+            'reviewers': reviewers
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
+@admin_bp.route('/analytics/pending-time', methods=['GET'])
+@protect
+@authorize('admin')
+def get_pending_time():
+    try:
+        start, end = parse_range()
+        percentiles = FormEvent.pending_time_percentiles(start, end, read_class='reporting')
+        
+        return jsonify({
+            'success': True,
+            'from': start.isoformat(),
+            'to': end.isoformat(),
+            'pendingTime': percentiles
         }), 200
         
     except Exception as e:
@@ -183,3 +261,18 @@ def get_stats():
             'error': str(e)
         }), 500
 
+@admin_bp.route('/metrics', methods=['GET'])
+@protect
+@authorize('admin')
+def get_metrics():
+    return jsonify({
+        'success': True,
+        'metrics': {
+            'formBatchWrites': {
+                'enabled': Config.FORM_BATCH_WRITES,
+                'forms': form_writer.stats(),
+                'formEvents': form_event_writer.stats()
+            },
+            'adminQueryCoalescing': admin_queries.stats()
+        }
+    }), 200
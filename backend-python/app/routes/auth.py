@@ -110,6 +110,13 @@ def login():
                 'message': 'Invalid credentials'
             }), 401
         
+        # Move the stored hash to the current bcrypt cost while we have the password
+        if User.needs_rehash(hashed_password):
+            try:
+                User.update_password_hash(user['_id'], password)
+            except Exception as error:
+                print(f'Password rehash failed: {error}')
+        
         # Generate token
         token = generate_token(user['_id'])
         
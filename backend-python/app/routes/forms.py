@@ -1,14 +1,91 @@
+from datetime import datetime, timedelta, timezone
 from flask import Blueprint, request, jsonify
 from bson import ObjectId
 from app.models.form import Form
+from app.models.form_event import FormEvent
+from app.models.remark import Remark
+from app.models.reminder import Reminder, ACTIVE_STATUSES, VALID_STATUSES as VALID_REMINDER_STATUSES
 from app.models.user import User
 from app.middleware.auth import protect
+from app.utils.reminder_scheduler import reminder_scheduler
 
 forms_bp = Blueprint('forms', __name__)
 
 VALID_CATEGORIES = ['Sales', 'Support', 'Marketing', 'HR', 'Other']
 VALID_PRIORITIES = ['Low', 'Medium', 'High']
 
+DEFAULT_REMARKS_LIMIT = 20
+MAX_REMARKS_LIMIT = 100
+DEFAULT_SUMMARY_RECENT = 5
+MAX_SUMMARY_RECENT = 50
+
+def parse_datetime(value):
+    """Parse an ISO 8601 string into a naive UTC datetime, or None if invalid"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def can_access_form(form):
+    """Form owners and admins may access a form"""
+    return str(form['userId']) == request.user_id or request.user.get('role') == 'admin'
+
+def create_reminder(form_id):
+    """Add a reminder from the request body; shared by the user and admin routes"""
+    data = request.get_json() or {}
+    
+    due_at = parse_datetime(data.get('dateTime'))
+    if not due_at:
+        return jsonify({
+            'success': False,
+            'errors': [{'field': 'dateTime', 'message': 'Valid date and time is required'}]
+        }), 400
+    
+    form = Form.find_by_id(form_id)
+    
+    if not form:
+        return jsonify({
+            'success': False,
+            'message': 'Form not found'
+        }), 404
+    
+    if not can_access_form(form):
+        return jsonify({
+            'success': False,
+            'message': 'Not authorized to set reminder on this form'
+        }), 403
+    
+    reminder = Reminder.create(form, due_at, data.get('message', ''), request.user)
+    reminder_scheduler.schedule(reminder)
+    
+    return jsonify({
+        'success': True,
+        'message': 'Reminder added successfully',
+        'reminder': Reminder.to_dict(reminder)
+    }), 200
+
+def reminders_with_forms(reminders):
+    """Serialize reminders together with a summary of their form"""
+    form_ids = list({reminder['formId'] for reminder in reminders})
+    forms = {form['_id']: form for form in Form.find_by_ids(form_ids)} if form_ids else {}
+    
+    results = []
+    for reminder in reminders:
+        form = forms.get(reminder['formId'], {})
+        results.append({
+            'id': str(reminder['_id']),
+            'formId': str(reminder['formId']),
+            'title': form.get('title'),
+            'status': form.get('status'),
+            'reminder': Reminder.to_dict(reminder)
+        })
+    return results
+
 @forms_bp.route('/', methods=['POST'])
 @protect
 def create_form():
@@ -50,8 +127,12 @@ def create_form():
             priority
         )
         
-        # Populate user info
-        form = Form.populate_user_info(form)
+        # The submitter is the authenticated user, already loaded by protect
+        form['userId'] = {
+            '_id': request.user['_id'],
+            'name': request.user.get('name'),
+            'email': request.user.get('email')
+        }
         
         return jsonify({
             'success': True,
@@ -93,6 +174,319 @@ def get_forms():
             'error': str(e)
         }), 500
 
+@forms_bp.route('/summary', methods=['GET'])
+@protect
+def get_summary():
+    try:
+        try:
+            recent_limit = int(request.args.get('limit', DEFAULT_SUMMARY_RECENT))
+        except ValueError:
+            recent_limit = DEFAULT_SUMMARY_RECENT
+        recent_limit = max(1, min(recent_limit, MAX_SUMMARY_RECENT))
+        
+        summary = Form.get_summary(request.user, recent_limit)
+        
+        return jsonify({
+            'success': True,
+            'counts': summary['counts'],
+            'recent': summary['recent']
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
+@forms_bp.route('/reminders', methods=['GET'])
+@protect
+def get_reminders():
+    try:
+        # Admins see every reminder, users only the ones assigned to them
+        assignee = None if request.user.get('role') == 'admin' else request.user_id
+        
+        due_before = None
+        if request.args.get('due') == 'true':
+            due_before = datetime.utcnow()
+        
+        reminders = Reminder.find_active(assignee, due_before=due_before)
+        results = reminders_with_forms(reminders)
+        
+        return jsonify({
+            'success': True,
+            'count': len(results),
+            'reminders': results
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
+@forms_bp.route('/reminders/due', methods=['GET'])
+@protect
+def get_due_reminders():
+    try:
+        since = None
+        if request.args.get('since'):
+            since = parse_datetime(request.args.get('since'))
+            if not since:
+                return jsonify({
+                    'success': False,
+                    'errors': [{'field': 'since', 'message': 'Invalid date'}]
+                }), 400
+        
+        # Served from the in-process scheduler rather than a database query
+        assignee = None if request.user.get('role') == 'admin' else request.user_id
+        reminders = reminder_scheduler.due(assignee, since)
+        results = reminders_with_forms(reminders)
+        
+        return jsonify({
+            'success': True,
+            'count': len(results),
+            'reminders': results,
+            'checkedAt': datetime.utcnow().isoformat()
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
+@forms_bp.route('/<form_id>/reminder', methods=['POST'])
+@protect
+def add_reminder(form_id):
+    try:
+        return create_reminder(form_id)
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
+@forms_bp.route('/<form_id>/reminders/<reminder_id>/status', methods=['PUT'])
+@protect
+def update_reminder_status(form_id, reminder_id):
+    try:
+        data = request.get_json() or {}
+        status = data.get('status')
+        message = data.get('message')
+        
+        if status and status not in VALID_REMINDER_STATUSES:
+            return jsonify({
+                'success': False,
+                'errors': [{'field': 'status', 'message': 'Invalid status'}]
+            }), 400
+        
+        form = Form.find_by_id(form_id)
+        
+        if not form:
+            return jsonify({
+                'success': False,
+                'message': 'Form not found'
+            }), 404
+        
+        if not can_access_form(form):
+            return jsonify({
+                'success': False,
+                'message': 'Not authorized to update this reminder'
+            }), 403
+        
+        reminder = Reminder.find_by_id(reminder_id)
+        if not reminder or reminder['formId'] != form['_id']:
+            return jsonify({
+                'success': False,
+                'message': 'Reminder not found'
+            }), 404
+        
+        new_reminder = None
+        if status == 'rescheduled':
+            due_at = parse_datetime(data.get('dateTime'))
+            if not due_at:
+                return jsonify({
+                    'success': False,
+                    'message': 'New date and time required for rescheduling'
+                }), 400
+            
+            # Keep the old reminder as history and create a new one
+            new_reminder = Reminder.create(
+                form,
+                due_at,
+                message if message is not None else reminder.get('message', ''),
+                request.user
+            )
+        
+        reminder = Reminder.update_status(
+            reminder_id,
+            status,
+            request.user_id,
+            message
+        )
+        
+        if reminder['status'] in ACTIVE_STATUSES:
+            reminder_scheduler.schedule(reminder)
+        else:
+            reminder_scheduler.cancel(reminder_id)
+        if new_reminder:
+            reminder_scheduler.schedule(new_reminder)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Reminder updated successfully',
+            'reminder': Reminder.to_dict(reminder),
+            'newReminder': Reminder.to_dict(new_reminder)
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
+@forms_bp.route('/<form_id>/remarks', methods=['POST'])
+@protect
+def add_remark(form_id):
+    try:
+        data = request.get_json() or {}
+        message = (data.get('message') or '').strip()
+        
+        if not message:
+            return jsonify({
+                'success': False,
+                'message': 'Message is required'
+            }), 400
+        
+        form = Form.find_by_id(form_id)
+        
+        if not form:
+            return jsonify({
+                'success': False,
+                'message': 'Form not found'
+            }), 404
+        
+        if not can_access_form(form):
+            return jsonify({
+                'success': False,
+                'message': 'Not authorized to add remarks to this form'
+            }), 403
+        
+        Remark.create(form_id, request.user, message)
+        
+        # Same shape as the Node route: the refreshed first page, newest first
+        remarks, next_cursor = Remark.find_by_form(form_id, DEFAULT_REMARKS_LIMIT)
+        
+        return jsonify({
+            'success': True,
+            'count': len(remarks),
+            'total': form.get('remarkCount', 0) + 1,
+            'nextCursor': next_cursor,
+            'data': [Remark.to_dict(remark) for remark in remarks]
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
+@forms_bp.route('/<form_id>/remarks', methods=['GET'])
+@protect
+def get_remarks(form_id):
+    try:
+        try:
+            limit = int(request.args.get('limit', DEFAULT_REMARKS_LIMIT))
+        except ValueError:
+            limit = DEFAULT_REMARKS_LIMIT
+        limit = max(1, min(limit, MAX_REMARKS_LIMIT))
+        
+        cursor = None
+        if request.args.get('cursor'):
+            cursor = Remark.decode_cursor(request.args.get('cursor'))
+            if not cursor:
+                return jsonify({
+                    'success': False,
+                    'errors': [{'field': 'cursor', 'message': 'Invalid cursor'}]
+                }), 400
+        
+        start_date = parse_datetime(request.args.get('startDate'))
+        end_date = parse_datetime(request.args.get('endDate'))
+        if end_date and len(request.args.get('endDate')) == 10:
+            # A bare date includes the whole end day
+            end_date = end_date + timedelta(days=1, microseconds=-1)
+        
+        form = Form.find_by_id(form_id)
+        
+        if not form:
+            return jsonify({
+                'success': False,
+                'message': 'Form not found'
+            }), 404
+        
+        if not can_access_form(form):
+            return jsonify({
+                'success': False,
+                'message': 'Not authorized to view remarks for this form'
+            }), 403
+        
+        remarks, next_cursor = Remark.find_by_form(form_id, limit, cursor, start_date, end_date)
+        
+        return jsonify({
+            'success': True,
+            'count': len(remarks),
+            'total': form.get('remarkCount', 0),
+            'nextCursor': next_cursor,
+            'data': [Remark.to_dict(remark) for remark in remarks]
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
+@forms_bp.route('/<form_id>/history', methods=['GET'])
+@protect
+def get_form_history(form_id):
+    try:
+        form = Form.find_by_id(form_id)
+        
+        if not form:
+            return jsonify({
+                'success': False,
+                'message': 'Form not found'
+            }), 404
+        
+        if not can_access_form(form):
+            return jsonify({
+                'success': False,
+                'message': 'Not authorized to view history for this form'
+            }), 403
+        
+        events = FormEvent.find_by_form(form_id)
+        
+        return jsonify({
+            'success': True,
+            'count': len(events),
+            'history': [FormEvent.to_dict(event) for event in events]
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Server error',
+            'error': str(e)
+        }), 500
+
 @forms_bp.route('/<form_id>', methods=['GET'])
 @protect
 def get_form(form_id):
@@ -156,6 +550,9 @@ def delete_form(form_id):
             }), 400
         
         Form.delete(form_id)
+        Reminder.delete_by_form(form_id)
+        Remark.delete_by_form(form_id)
+        reminder_scheduler.cancel_form(form_id)
         
         return jsonify({
             'success': True,
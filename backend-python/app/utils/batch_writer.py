@@ -0,0 +1,108 @@
+import threading
+import time
+from concurrent.futures import Future
+from pymongo.errors import BulkWriteError, WriteError
+from app.config.db import get_db
+
+class BatchWriter:
+    """Group-commit writer that inserts concurrently submitted documents together.
+
+    submit() queues a document (which must already carry its `_id`) and
+    returns a Future. A background thread flushes the queue with a single
+    insert_many once max_size documents are waiting or the oldest one has
+    waited max_delay_ms, then resolves each Future with its document's `_id`.
+    """
+
+    def __init__(self, collection_name, max_size, max_delay_ms):
+        self.collection_name = collection_name
+        self.max_size = max_size
+        self.max_delay = max_delay_ms / 1000
+        self._cond = threading.Condition()
+        self._queue = []
+        self._thread = None
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._documents = 0
+        self._max_batch_size = 0
+        self._flush_ms_total = 0.0
+        self._flush_ms_max = 0.0
+        self._wait_ms_total = 0.0
+
+    def submit(self, document):
+        future = Future()
+        with self._cond:
+            if self._thread is None:
+                # Started lazily so no thread exists before a worker forks
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f'{self.collection_name}-batch-writer',
+                    daemon=True
+                )
+                self._thread.start()
+            self._queue.append((document, future, time.perf_counter()))
+            self._cond.notify()
+        return future
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                deadline = self._queue[0][2] + self.max_delay
+                while len(self._queue) < self.max_size:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._queue[:self.max_size]
+                del self._queue[:self.max_size]
+            self._flush(batch)
+
+    def _flush(self, batch):
+        start = time.perf_counter()
+        failed = {}
+        try:
+            get_db()[self.collection_name].insert_many(
+                [document for document, _, _ in batch],
+                ordered=False
+            )
+        except BulkWriteError as error:
+            failed = {write_error['index']: write_error for write_error in error.details.get('writeErrors', [])}
+        except Exception as error:
+            failed = {index: error for index in range(len(batch))}
+        end = time.perf_counter()
+        
+        for index, (document, future, _) in enumerate(batch):
+            write_error = failed.get(index)
+            if write_error is None:
+                future.set_result(document['_id'])
+            elif isinstance(write_error, Exception):
+                future.set_exception(write_error)
+            else:
+                future.set_exception(WriteError(write_error.get('errmsg'), write_error.get('code'), write_error))
+        
+        self._record(batch, start, end)
+
+    def _record(self, batch, start, end):
+        flush_ms = (end - start) * 1000
+        with self._stats_lock:
+            self._batches += 1
+            self._documents += len(batch)
+            self._max_batch_size = max(self._max_batch_size, len(batch))
+            self._flush_ms_total += flush_ms
+            self._flush_ms_max = max(self._flush_ms_max, flush_ms)
+            self._wait_ms_total += sum((end - submitted_at) * 1000 for _, _, submitted_at in batch)
+
+    def stats(self):
+        with self._stats_lock:
+            batches = self._batches or 1
+            documents = self._documents or 1
+            return {
+                'batches': self._batches,
+                'documents': self._documents,
+                'averageBatchSize': round(self._documents / batches, 2),
+                'maxBatchSize': self._max_batch_size,
+                'averageFlushMs': round(self._flush_ms_total / batches, 2),
+                'maxFlushMs': round(self._flush_ms_max, 2),
+                'averageWaitMs': round(self._wait_ms_total / documents, 2)
+            }
@@ -0,0 +1,111 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+import brotli
+from flask import request
+
+COMPRESSIBLE_MIMETYPES = {'application/json', 'text/html', 'text/plain', 'text/css', 'application/javascript'}
+
+class CompressedBodyCache:
+    """LRU cache of compressed bodies keyed by encoding and body digest.
+
+    Repeat loads of an unchanged list or stats response hash the body
+    (cheap) instead of compressing it again (expensive).
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, key, body):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+def choose_encoding(accept_encodings):
+    """Pick the best supported encoding from an Accept-Encoding header"""
+    if accept_encodings.quality('br') > 0:
+        return 'br'
+    if accept_encodings.quality('gzip') > 0:
+        return 'gzip'
+    return None
+
+def compress(body, encoding, config):
+    if encoding == 'br':
+        return brotli.compress(body, quality=config['COMPRESSION_BROTLI_QUALITY'])
+    return gzip.compress(body, compresslevel=config['COMPRESSION_GZIP_LEVEL'], mtime=0)
+
+def init_compression(app):
+    """Compress large responses with gzip or brotli based on Accept-Encoding"""
+    if not app.config['COMPRESSION_ENABLED']:
+        return
+    
+    cache = CompressedBodyCache(app.config['COMPRESSION_CACHE_MAX_BYTES'])
+    app.extensions['compression_cache'] = cache
+    
+    @app.after_request
+    def compress_response(response):
+        response.vary.add('Accept-Encoding')
+        
+        if (response.direct_passthrough
+                or response.status_code < 200
+                or response.status_code in (204, 304)
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+            return response
+        
+        encoding = choose_encoding(request.accept_encodings)
+        if not encoding:
+            return response
+        
+        body = response.get_data()
+        if len(body) < app.config['COMPRESSION_MIN_SIZE']:
+            return response
+        
+        # Only GET bodies repeat often enough to be worth caching
+        compressed = None
+        cache_key = None
+        if request.method == 'GET':
+            cache_key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+            compressed = cache.get(cache_key)
+        
+        if compressed is None:
+            compressed = compress(body, encoding, app.config)
+            if cache_key is not None:
+                cache.set(cache_key, compressed)
+        
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        response.headers['Content-Length'] = len(compressed)
+        return response
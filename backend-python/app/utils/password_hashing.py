@@ -0,0 +1,54 @@
+import math
+import time
+import bcrypt
+from app.config import Config
+
+# Cheap cost timed during calibration; higher costs are extrapolated from it
+CALIBRATION_ROUNDS = 5
+CALIBRATION_SAMPLES = 3
+
+_rounds = None
+
+def calibrate_rounds(target_ms, min_rounds, max_rounds):
+    """Largest bcrypt cost whose hash time stays within target_ms on this machine.
+
+    Each extra round doubles the work, so the fastest of a few hashes at
+    CALIBRATION_ROUNDS is enough to estimate the time of every higher cost
+    (a few milliseconds in total, instead of hashing at min_rounds).
+    """
+    password = b'calibration-password'
+    salt = bcrypt.gensalt(rounds=CALIBRATION_ROUNDS)
+    elapsed_ms = []
+    for _ in range(CALIBRATION_SAMPLES):
+        start = time.perf_counter()
+        bcrypt.hashpw(password, salt)
+        elapsed_ms.append((time.perf_counter() - start) * 1000)
+    
+    base_ms = max(min(elapsed_ms), 0.001)
+    rounds = CALIBRATION_ROUNDS + int(math.floor(math.log2(target_ms / base_ms)))
+    return max(min_rounds, min(rounds, max_rounds))
+
+def configure_rounds():
+    """Pick the bcrypt cost: BCRYPT_ROUNDS if set, otherwise calibrate to BCRYPT_TARGET_MS"""
+    global _rounds
+    if Config.BCRYPT_ROUNDS:
+        _rounds = Config.BCRYPT_ROUNDS
+    else:
+        _rounds = calibrate_rounds(
+            Config.BCRYPT_TARGET_MS,
+            Config.BCRYPT_MIN_ROUNDS,
+            Config.BCRYPT_MAX_ROUNDS
+        )
+    return _rounds
+
+def get_rounds():
+    if _rounds is None:
+        configure_rounds()
+    return _rounds
+
+def hash_rounds(hashed_password):
+    """Cost factor stored in a bcrypt hash such as $2b$12$..."""
+    try:
+        return int(hashed_password.split('$')[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
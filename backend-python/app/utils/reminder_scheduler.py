@@ -0,0 +1,152 @@
+import heapq
+import threading
+from datetime import datetime, timedelta
+from app.config import Config
+
+class ReminderScheduler:
+    """In-process min-heap of upcoming reminders keyed by due time.
+
+    Reminders due within the next reload window are loaded from MongoDB once
+    per window; reminders created or updated in this process are pushed onto
+    the heap directly. Asking for due reminders pops every entry whose due
+    time has passed, so newly due reminders are served from memory rather
+    than by polling the database.
+
+    The heap is per process and only sees the schedule()/cancel() calls made
+    in that process. With several workers, a reminder added or completed in
+    another worker shows up here only after the next reload (up to
+    REMINDER_SCHEDULER_RELOAD_SECONDS), so /reminders/due assumes a single
+    worker process.
+    """
+
+    def __init__(self, reload_seconds):
+        self.reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._heap = []
+        self._scheduled = {}
+        self._due = {}
+        self._loaded_until = None
+        self._reloading = False
+        # schedule()/cancel() calls made while a reload query is running,
+        # replayed onto the reloaded heap
+        self._pending_changes = []
+
+    def _push(self, reminder):
+        reminder_id = str(reminder['_id'])
+        self._scheduled[reminder_id] = reminder
+        heapq.heappush(self._heap, (reminder['dueAt'], reminder_id))
+
+    def _reload(self, now):
+        """Reload the next window from MongoDB if the current one has passed.
+
+        The query runs without holding the lock, so schedule()/cancel() are
+        not blocked behind it; only one thread reloads a loaded heap at a time.
+        """
+        from app.models.reminder import Reminder
+        
+        with self._lock:
+            if self._loaded_until is not None and (now < self._loaded_until or self._reloading):
+                return
+            self._reloading = True
+            self._pending_changes = []
+        
+        try:
+            horizon = now + timedelta(seconds=self.reload_seconds)
+            reminders = Reminder.find_active(due_before=horizon)
+        except Exception:
+            with self._lock:
+                self._reloading = False
+            raise
+        
+        with self._lock:
+            self._heap = []
+            self._scheduled = {}
+            self._due = {}
+            for reminder in reminders:
+                self._push(reminder)
+            self._loaded_until = horizon
+            
+            for change, arg in self._pending_changes:
+                change(arg)
+            self._pending_changes = []
+            self._reloading = False
+
+    def _fire_due(self, now):
+        while self._heap and self._heap[0][0] <= now:
+            due_at, reminder_id = heapq.heappop(self._heap)
+            reminder = self._scheduled.get(reminder_id)
+            # Skip entries superseded by a later schedule() or cancel()
+            if reminder is None or reminder['dueAt'] != due_at:
+                continue
+            del self._scheduled[reminder_id]
+            self._due.setdefault(str(reminder['assignee']), {})[reminder_id] = reminder
+
+    def _apply(self, change, arg):
+        with self._lock:
+            change(arg)
+            if self._reloading:
+                self._pending_changes.append((change, arg))
+
+    def schedule(self, reminder):
+        """Track a new or rescheduled active reminder"""
+        self._apply(self._schedule, reminder)
+
+    def cancel(self, reminder_id):
+        """Stop tracking a reminder that is no longer active"""
+        self._apply(self._discard, str(reminder_id))
+
+    def cancel_form(self, form_id):
+        """Stop tracking every reminder of a deleted form"""
+        self._apply(self._cancel_form, str(form_id))
+
+    def _schedule(self, reminder):
+        self._discard(str(reminder['_id']))
+        if self._loaded_until is not None and reminder['dueAt'] <= self._loaded_until:
+            self._push(reminder)
+
+    def _cancel_form(self, form_id):
+        reminder_ids = [
+            reminder_id
+            for reminder_id, reminder in self._scheduled.items()
+            if str(reminder['formId']) == form_id
+        ]
+        for reminders in self._due.values():
+            reminder_ids.extend(
+                reminder_id
+                for reminder_id, reminder in reminders.items()
+                if str(reminder['formId']) == form_id
+            )
+        for reminder_id in reminder_ids:
+            self._discard(reminder_id)
+
+    def _discard(self, reminder_id):
+        self._scheduled.pop(reminder_id, None)
+        for reminders in self._due.values():
+            reminders.pop(reminder_id, None)
+
+    def due(self, assignee=None, since=None):
+        """Active reminders that are due now, oldest first.
+
+        Limited to one assignee when given (all assignees otherwise) and to
+        reminders that became due after `since` when given.
+        """
+        now = datetime.utcnow()
+        self._reload(now)
+        with self._lock:
+            self._fire_due(now)
+            
+            if assignee is not None:
+                buckets = [self._due.get(str(assignee), {})]
+            else:
+                buckets = self._due.values()
+            
+            reminders = [
+                reminder
+                for bucket in buckets
+                for reminder in bucket.values()
+                if since is None or reminder['dueAt'] > since
+            ]
+        
+        return sorted(reminders, key=lambda reminder: reminder['dueAt'])
+
+reminder_scheduler = ReminderScheduler(Config.REMINDER_SCHEDULER_RELOAD_SECONDS)
@@ -0,0 +1,322 @@
+"""Query-plan regression tests for the model queries.
+
+Every model query is run against a seeded local MongoDB while its commands
+are recorded, and each recorded command is re-run through `explain`. A test
+fails when a query stops using an index (COLLSCAN or an in-memory SORT in the
+winning plan) or examines too many keys/documents per result.
+
+Set QUERY_PLAN_MONGODB_URI to point at another server; the database named in
+the URI is dropped before and after the run. The suite is skipped when no
+server is reachable.
+"""
+import copy
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from pymongo.monitoring import CommandListener
+
+import app.config.db as db_module
+from app.models.form import Form, summary_cache
+from app.models.form_event import FormEvent
+from app.models.remark import Remark
+from app.models.reminder import Reminder
+from app.models.user import User
+
+MONGODB_URI = os.getenv('QUERY_PLAN_MONGODB_URI', 'mongodb://localhost:27017/crm_query_plan_test')
+# CI sets REQUIRE_MONGODB=true so an unreachable server fails the run instead of skipping it
+REQUIRE_MONGODB = os.getenv('REQUIRE_MONGODB', 'false').lower() == 'true'
+
+# Upper bounds on index keys / documents examined per returned or matched document
+MAX_KEYS_PER_RESULT = 2
+MAX_DOCS_PER_RESULT = 1
+
+USERS = 5
+FORMS_PER_USER = 40
+STATUSES = ['pending', 'approved', 'rejected']
+
+EXPLAINED_COMMANDS = {'find', 'aggregate', 'count', 'distinct', 'update', 'delete', 'findAndModify'}
+GROUP_STAGES = {'group', 'hash_agg'}
+INDEX_STAGES = {'IXSCAN', 'IDHACK', 'COUNT_SCAN', 'DISTINCT_SCAN', 'RECORD_STORE_FAST_COUNT'}
+# Command fields that explain rejects or that only matter to the driver
+DRIVER_FIELDS = {'lsid', 'txnNumber', 'autocommit', 'writeConcern', 'readConcern'}
+
+class CommandRecorder(CommandListener):
+    def __init__(self):
+        self.commands = []
+
+    def started(self, event):
+        if event.command_name in EXPLAINED_COMMANDS:
+            self.commands.append(copy.deepcopy(dict(event.command)))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+recorder = CommandRecorder()
+
+def mongodb_unavailable(reason):
+    if REQUIRE_MONGODB:
+        pytest.fail(reason)
+    pytest.skip(reason)
+
+@pytest.fixture(scope='module')
+def seed():
+    client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=1000, event_listeners=[recorder])
+    try:
+        client.admin.command('ping')
+    except PyMongoError as error:
+        mongodb_unavailable(f'MongoDB not available for query-plan tests: {error}')
+    
+    database = client.get_database()
+    client.drop_database(database.name)
+    
+    db_module.client = client
+    db_module.db = database
+    assert db_module.ensure_indexes() == []
+    
+    now = datetime.utcnow()
+    users = [
+        {'_id': ObjectId(), 'name': f'User {i}', 'email': f'user{i}@example.com', 'role': 'user', 'createdAt': now}
+        for i in range(USERS)
+    ]
+    admin = {'_id': ObjectId(), 'name': 'Admin', 'email': 'admin@example.com', 'role': 'admin', 'createdAt': now}
+    database.users.insert_many(users + [admin])
+    
+    forms = []
+    for user_index, user in enumerate(users):
+        for i in range(FORMS_PER_USER):
+            forms.append({
+                '_id': ObjectId(),
+                'userId': user['_id'],
+                'title': f'Form {user_index}-{i}',
+                'description': 'Seeded form',
+                'category': 'Sales',
+                'priority': 'Medium',
+                'status': STATUSES[(user_index + i) % len(STATUSES)],
+                'reviewedBy': None,
+                'reviewedAt': None,
+                'reviewComment': '',
+                'remarkCount': 0,
+                'lastRemark': None,
+                'createdAt': now - timedelta(minutes=user_index * FORMS_PER_USER + i),
+                'updatedAt': now
+            })
+    database.forms.insert_many(forms)
+    
+    reminders = []
+    remarks = []
+    for i, form in enumerate(forms):
+        reminders.append({
+            'formId': form['_id'],
+            'assignee': form['userId'],
+            'dueAt': now + timedelta(hours=i - len(forms) // 2),
+            'message': 'Call back',
+            'status': ['pending', 'completed', 'incomplete', 'rescheduled'][i % 4],
+            'setBy': admin['_id'],
+            'setByName': admin['name'],
+            'completedAt': None,
+            'completedBy': None,
+            'createdAt': now
+        })
+        if i < 20:
+            for j in range(10):
+                remarks.append({
+                    'formId': form['_id'],
+                    'senderId': form['userId'],
+                    'senderName': 'User',
+                    'senderRole': 'user',
+                    'message': f'Remark {j}',
+                    'createdAt': now - timedelta(minutes=j)
+                })
+    database.reminders.insert_many(reminders)
+    database.remarks.insert_many(remarks)
+    
+    events = []
+    for i, form in enumerate(forms):
+        events.append({
+            'formId': form['_id'],
+            'from': None,
+            'to': 'pending',
+            'actor': form['userId'],
+            'at': form['createdAt'],
+            'durationMs': None
+        })
+        if form['status'] != 'pending':
+            events.append({
+                'formId': form['_id'],
+                'from': 'pending',
+                'to': form['status'],
+                'actor': admin['_id'],
+                'at': form['createdAt'] + timedelta(minutes=30),
+                'durationMs': (i % 60 + 1) * 60 * 1000
+            })
+    database.form_events.insert_many(events)
+    
+    yield {
+        'db': database,
+        'users': users,
+        'admin': admin,
+        'forms': forms,
+        'reminders': reminders,
+        'now': now
+    }
+    
+    client.drop_database(database.name)
+    client.close()
+    db_module.client = None
+    db_module.db = None
+
+def _find_key(document, key):
+    """First value stored under `key` anywhere in a nested explain document"""
+    if isinstance(document, dict):
+        if key in document:
+            return document[key]
+        values = document.values()
+    elif isinstance(document, list):
+        values = document
+    else:
+        return None
+    for value in values:
+        found = _find_key(value, key)
+        if found is not None:
+            return found
+    return None
+
+def _plan_stages(plan):
+    """Stage names of a winning plan, including slot-based engine query plans"""
+    if not isinstance(plan, dict):
+        return []
+    if 'queryPlan' in plan:
+        plan = plan['queryPlan']
+    stages = [plan['stage']] if 'stage' in plan else []
+    if 'inputStage' in plan:
+        stages.extend(_plan_stages(plan['inputStage']))
+    for child in plan.get('inputStages', []):
+        stages.extend(_plan_stages(child))
+    return stages
+
+def _child_stages(stage):
+    """Direct input stages of an executionStages node (classic or slot-based)"""
+    children = []
+    for key, value in stage.items():
+        if isinstance(value, dict) and 'stage' in value:
+            children.append(value)
+        elif key == 'inputStages' and isinstance(value, list):
+            children.extend(value)
+    return children
+
+def _group_input_returned(stage):
+    """nReturned of the stage feeding a $group run inside the query engine.
+
+    With slot-based execution the top-level nReturned counts grouped output
+    rows, not the documents the index scan/fetch produced.
+    """
+    if not isinstance(stage, dict):
+        return 0
+    if stage.get('stage', '').lower() in GROUP_STAGES:
+        return max((child.get('nReturned', 0) for child in _child_stages(stage)), default=0)
+    return max((_group_input_returned(child) for child in _child_stages(stage)), default=0)
+
+def _explain(database, command):
+    command = {key: value for key, value in command.items() if not key.startswith('$') and key not in DRIVER_FIELDS}
+    return database.command({'explain': command, 'verbosity': 'executionStats'})
+
+def _assert_indexed(database, command):
+    explain = _explain(database, command)
+    label = f"{next(iter(command))} {command}"
+    
+    stages = _plan_stages(_find_key(explain, 'winningPlan'))
+    assert stages, f'no winning plan for {label}'
+    assert 'COLLSCAN' not in stages, f'collection scan for {label}: {stages}'
+    assert 'SORT' not in stages, f'in-memory sort for {label}: {stages}'
+    assert any(stage in INDEX_STAGES or stage.startswith('EXPRESS') for stage in stages), \
+        f'no index stage for {label}: {stages}'
+    
+    stats = _find_key(explain, 'executionStats')
+    execution_stages = stats.get('executionStages', {})
+    results = max(
+        stats.get('nReturned', 0),
+        _group_input_returned(execution_stages),
+        execution_stages.get('nMatched', 0),
+        execution_stages.get('nWouldDelete', 0),
+        execution_stages.get('nCounted', 0)
+    )
+    keys_examined = stats.get('totalKeysExamined', 0)
+    docs_examined = stats.get('totalDocsExamined', 0)
+    # Covered plans (e.g. counts) read one index key per matching document
+    covered = docs_examined == 0 and 'FETCH' not in stages
+    if not covered:
+        assert keys_examined <= MAX_KEYS_PER_RESULT * results + 1, \
+            f'{keys_examined} keys examined for {results} results: {label}'
+    assert docs_examined <= MAX_DOCS_PER_RESULT * results + 1, \
+        f'{docs_examined} documents examined for {results} results: {label}'
+
+def _run(seed, query):
+    recorder.commands.clear()
+    summary_cache.clear()
+    query(seed)
+    commands = list(recorder.commands)
+    assert commands, 'query issued no explainable commands'
+    for command in commands:
+        _assert_indexed(seed['db'], command)
+
+def _form(seed, index=0):
+    return seed['forms'][index]
+
+def _new_form(seed):
+    form = dict(_form(seed), _id=ObjectId(), status='pending')
+    seed['db'].forms.insert_one(form)
+    return form
+
+QUERIES = {
+    'Form.find_by_id': lambda seed: Form.find_by_id(_form(seed)['_id']),
+    'Form.find_by_ids': lambda seed: Form.find_by_ids([form['_id'] for form in seed['forms'][:10]]),
+    'Form.find_by_user_id': lambda seed: Form.find_by_user_id(seed['users'][0]['_id']),
+    'Form.find_by_user_id with status': lambda seed: Form.find_by_user_id(seed['users'][1]['_id'], 'approved'),
+    'Form.find_all': lambda seed: Form.find_all(),
+    'Form.find_all with status': lambda seed: Form.find_all('rejected'),
+    'Form.find_pending': lambda seed: Form.find_pending(),
+    'Form.update_status': lambda seed: Form.update_status(_new_form(seed)['_id'], 'approved', seed['admin']['_id'], 'ok'),
+    'Form.delete': lambda seed: Form.delete(_new_form(seed)['_id']),
+    'Form.count_all': lambda seed: Form.count_all(),
+    'Form.count_by_status': lambda seed: Form.count_by_status('pending'),
+    'Form.get_summary': lambda seed: Form.get_summary(seed['users'][2], 5),
+    'User.find_by_email': lambda seed: User.find_by_email('user3@example.com'),
+    'User.find_by_id': lambda seed: User.find_by_id(seed['users'][3]['_id']),
+    'User.find_by_ids': lambda seed: User.find_by_ids([user['_id'] for user in seed['users']]),
+    'User.update_password_hash': lambda seed: User.update_password_hash(seed['users'][4]['_id'], 'new-password'),
+    'Reminder.find_by_id': lambda seed: Reminder.find_by_id(seed['reminders'][0]['_id']),
+    'Reminder.find_active for assignee': lambda seed: Reminder.find_active(seed['users'][0]['_id']),
+    'Reminder.find_active due for assignee': lambda seed: Reminder.find_active(seed['users'][0]['_id'], due_before=seed['now']),
+    'Reminder.find_active for everyone': lambda seed: Reminder.find_active(due_before=seed['now'] + timedelta(hours=2)),
+    'Reminder.update_status': lambda seed: Reminder.update_status(seed['reminders'][1]['_id'], 'completed', seed['admin']['_id']),
+    'Reminder.delete_by_form': lambda seed: Reminder.delete_by_form(_form(seed, 30)['_id']),
+    'Remark.create': lambda seed: Remark.create(_form(seed, 1)['_id'], seed['admin'], 'Looks good'),
+    'Remark.find_by_form': lambda seed: Remark.find_by_form(_form(seed, 2)['_id'], 5),
+    'Remark.find_by_form next page': lambda seed: Remark.find_by_form(
+        _form(seed, 3)['_id'],
+        5,
+        Remark.decode_cursor(Remark.find_by_form(_form(seed, 3)['_id'], 5)[1])
+    ),
+    'Remark.delete_by_form': lambda seed: Remark.delete_by_form(_form(seed, 4)['_id']),
+    'FormEvent.find_by_form': lambda seed: FormEvent.find_by_form(_form(seed, 5)['_id']),
+    'FormEvent.reviewer_throughput': lambda seed: FormEvent.reviewer_throughput(
+        seed['now'] - timedelta(days=30), seed['now'] + timedelta(days=1)
+    ),
+    'FormEvent.reviewer_throughput for reviewer': lambda seed: FormEvent.reviewer_throughput(
+        seed['now'] - timedelta(days=30), seed['now'] + timedelta(days=1), seed['admin']['_id']
+    ),
+    'FormEvent.pending_time_percentiles': lambda seed: FormEvent.pending_time_percentiles(
+        seed['now'] - timedelta(days=30), seed['now'] + timedelta(days=1)
+    )
+}
+
+@pytest.mark.parametrize('name', list(QUERIES))
+def test_query_uses_index(seed, name):
+    _run(seed, QUERIES[name])
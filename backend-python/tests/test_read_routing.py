@@ -0,0 +1,148 @@
+"""Read routing tests for the per-route-class read preferences.
+
+The configuration checks need no server. The routing checks run against a
+replica set (a local single-host one is enough, e.g. `mongod --replSet rs0`
+followed by `rs.initiate()`) and inspect the `$readPreference` the driver
+sends with each model query. Set READ_ROUTING_MONGODB_URI to point elsewhere;
+the database named in the URI is dropped before and after the run.
+"""
+import copy
+import os
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from pymongo.monitoring import CommandListener
+from pymongo.read_preferences import Primary, SecondaryPreferred
+
+import app.config.db as db_module
+from app.config import Config
+from app.config.db import READ_PREFERENCES, build_read_preference
+from app.models.form import Form
+from app.routes.admin import forms_payload
+
+MONGODB_URI = os.getenv('READ_ROUTING_MONGODB_URI', 'mongodb://localhost:27017/crm_read_routing_test?replicaSet=rs0')
+# CI sets REQUIRE_MONGODB=true so an unreachable server fails the run instead of skipping it
+REQUIRE_MONGODB = os.getenv('REQUIRE_MONGODB', 'false').lower() == 'true'
+
+class CommandRecorder(CommandListener):
+    def __init__(self):
+        self.commands = []
+
+    def started(self, event):
+        self.commands.append((event.command_name, copy.deepcopy(dict(event.command))))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+recorder = CommandRecorder()
+
+def mongodb_unavailable(reason):
+    if REQUIRE_MONGODB:
+        pytest.fail(reason)
+    pytest.skip(reason)
+
+def test_default_reads_use_primary():
+    assert READ_PREFERENCES['default'] == Primary()
+
+def test_reporting_reads_use_configured_preference():
+    expected = build_read_preference(Config.REPORTING_READ_PREFERENCE, Config.REPORTING_MAX_STALENESS_SECONDS)
+    assert READ_PREFERENCES['reporting'] == expected
+
+def test_build_read_preference():
+    assert build_read_preference('primary', 120) == Primary()
+    assert build_read_preference('secondaryPreferred', 120) == SecondaryPreferred(max_staleness=120)
+    with pytest.raises(ValueError):
+        build_read_preference('fastest')
+
+@pytest.fixture(scope='module')
+def replica_set():
+    client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=1000, event_listeners=[recorder])
+    try:
+        hello = client.admin.command('hello')
+    except PyMongoError as error:
+        mongodb_unavailable(f'MongoDB replica set not available for read routing tests: {error}')
+    if 'setName' not in hello:
+        client.close()
+        mongodb_unavailable('MongoDB server is not a replica set member')
+    
+    database = client.get_database()
+    client.drop_database(database.name)
+    
+    db_module.client = client
+    db_module.db = database
+    
+    now = datetime.utcnow()
+    submitter = {'_id': ObjectId(), 'name': 'Submitter', 'email': 'submitter@example.com', 'role': 'user', 'createdAt': now}
+    reviewer = {'_id': ObjectId(), 'name': 'Reviewer', 'email': 'reviewer@example.com', 'role': 'admin', 'createdAt': now}
+    database.users.insert_many([submitter, reviewer])
+    form = {
+        '_id': ObjectId(),
+        'userId': submitter['_id'],
+        'title': 'Routing',
+        'description': 'Read routing test form',
+        'category': 'Other',
+        'priority': 'Medium',
+        'status': 'pending',
+        'reviewedBy': reviewer['_id'],
+        'statusChangedAt': now,
+        'createdAt': now,
+        'updatedAt': now
+    }
+    database.forms.insert_one(form)
+    
+    yield {'form': form, 'reviewer': reviewer['_id']}
+    
+    client.drop_database(database.name)
+    client.close()
+    db_module.client = None
+    db_module.db = None
+
+def _sent_read_modes(query, command_names):
+    recorder.commands.clear()
+    query()
+    return [
+        command.get('$readPreference', {'mode': 'primary'})
+        for name, command in recorder.commands
+        if name in command_names
+    ]
+
+def test_reporting_queries_send_reporting_preference(replica_set):
+    expected = READ_PREFERENCES['reporting'].document
+    
+    for query in (
+        lambda: Form.find_all(read_class='reporting'),
+        lambda: Form.find_pending(read_class='reporting'),
+        lambda: Form.count_by_status('pending', read_class='reporting')
+    ):
+        modes = _sent_read_modes(query, {'find', 'aggregate'})
+        assert modes and all(mode == expected for mode in modes)
+
+def test_admin_form_list_reads_users_on_reporting(replica_set):
+    expected = READ_PREFERENCES['reporting'].document
+    
+    recorder.commands.clear()
+    payload = forms_payload(Form.find_all(read_class='reporting'))
+    finds = [command for name, command in recorder.commands if name == 'find']
+    
+    assert sorted(command['find'] for command in finds) == ['forms', 'users']
+    assert all(command.get('$readPreference', {'mode': 'primary'}) == expected for command in finds)
+    assert payload['forms'][0]['userId']['name'] == 'Submitter'
+    assert payload['forms'][0]['reviewedBy']['name'] == 'Reviewer'
+
+def test_writes_and_own_reads_stay_on_primary(replica_set):
+    form_id = replica_set['form']['_id']
+    
+    modes = _sent_read_modes(lambda: Form.find_by_id(form_id), {'find'})
+    assert modes and all(mode['mode'] == 'primary' for mode in modes)
+    
+    modes = _sent_read_modes(
+        lambda: Form.update_status(form_id, 'approved', replica_set['reviewer'], 'ok'),
+        {'findAndModify', 'insert'}
+    )
+    assert modes and all(mode['mode'] == 'primary' for mode in modes)